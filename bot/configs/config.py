@@ -3,3 +3,4 @@ TIMEOUT_SECONDS = 14400
 PAUSE_TIMEOUT_SECONDS = 1800
 MAX_INTERVAL_MINUTES = 180
 COGS_PATH = './cogs'
+AUTOMUTE_MAX_CONCURRENT_EDITS = 5
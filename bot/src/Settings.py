@@ -1,4 +1,5 @@
 import logging
+from dataclasses import dataclass
 
 import discord
 from configs import user_messages as u_msg, config
@@ -7,13 +8,12 @@ from configs.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-
-    def __init__(self, duration, short_break=None, long_break=None, intervals=None):
-        self.duration = duration
-        self.short_break = short_break
-        self.long_break = long_break
-        self.intervals = intervals
+    duration: int
+    short_break: int | None = None
+    long_break: int | None = None
+    intervals: int | None = None
 
     @classmethod
     async def is_valid(cls, ctx, duration: int, short_break: int = None,
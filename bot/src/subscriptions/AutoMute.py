@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from discord.ext.commands import Context
@@ -6,6 +7,7 @@ from discord import User, Member, HTTPException
 
 from ..voice_client import vc_accessor
 from .Subscription import Subscription
+from configs import config
 from configs.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +26,8 @@ class AutoMute(Subscription):
     def __init__(self):
         super().__init__()
         self.all = False
+        # メンバー編集APIの同時実行数を制限し、レート制限(429)の連発を防ぐ
+        self._edit_limiter = asyncio.Semaphore(config.AUTOMUTE_MAX_CONCURRENT_EDITS)
 
     def _get_author(self, ctx) -> Member | None:
         """Get author from either Context or Interaction"""
@@ -53,7 +57,8 @@ class AutoMute(Subscription):
     async def safe_edit_member(self, member: Member, unmute=False, channel_name=None):
         """安全にメンバーの音声状態を編集する"""
         try:
-            await member.edit(mute=not unmute)
+            async with self._edit_limiter:
+                await member.edit(mute=not unmute)
             action = "unmuted" if unmute else "muted"
             logger.info(f"Successfully {action} {member.display_name}")
         except HTTPException as e:
@@ -68,6 +73,17 @@ class AutoMute(Subscription):
         except Exception as e:
             logger.warning(f"Failed to edit member {member.display_name}: {e}")
 
+    async def _edit_members(self, members, **kwargs):
+        """複数メンバーの音声状態を並行して編集する（同時実行数はsafe_edit_member側で制限）"""
+        results = await asyncio.gather(
+            *(self.safe_edit_member(member, **kwargs) for member in members),
+            return_exceptions=True
+        )
+        # safe_edit_memberは例外を握りつぶすため、ここに来るのはキャンセル等の想定外のもののみ
+        for member, result in zip(members, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to edit member {member.display_name}: {result}")
+
     async def mute(self, ctx: Context, who=None):
         vc_members = vc_accessor.get_true_members_in_voice_channel(ctx)
         vc = vc_accessor.get_voice_channel(ctx)
@@ -81,8 +97,7 @@ class AutoMute(Subscription):
             return
         
         if who == ALL or self.all:
-            for member in vc_members:
-                await self.safe_edit_member(member)
+            await self._edit_members(vc_members)
 
     async def unmute(self, ctx: Context, who=None):
         vc_members = vc_accessor.get_true_members_in_voice_channel(ctx)
@@ -97,8 +112,7 @@ class AutoMute(Subscription):
             return
         
         if who == ALL or self.all:
-            for member in vc_members:
-                await self.safe_edit_member(member, unmute=True)
+            await self._edit_members(vc_members, unmute=True)
 
     async def handle_all(self, ctx, enable=None):
         logger.debug("Getting voice channel for automute")
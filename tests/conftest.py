@@ -13,6 +13,34 @@ from tests.mocks.discord_mocks import (
 )
 from tests.mocks.voice_mocks import MockVoiceClient
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def pytest_configure(config):
+    """Register the markers the suite uses, so runs stay warning-free"""
+    # pytest.ini uses a [tool:pytest] section, which pytest only reads from
+    # setup.cfg, so the markers listed there are not picked up
+    config.addinivalue_line("markers", "slow: long-running tests; deselect with -m 'not slow'")
+    # pytest-xdist registers this itself; it is only needed when xdist is not installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests on a single pytest-xdist worker"
+    )
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Fixture providing uvloop's event loop policy where it is available
+
+    Falls back to the default asyncio policy on Windows or when uvloop is
+    not installed, so the suite still runs everywhere.
+    """
+    if uvloop is not None and sys.platform != 'win32':
+        return uvloop.EventLoopPolicy()
+    return asyncio.get_event_loop_policy()
+
 
 @pytest.fixture
 def mock_bot():
@@ -0,0 +1,3 @@
+"""
+Shared immutable test data.
+"""
@@ -0,0 +1,7 @@
+"""
+Shared Settings instances for tests.
+"""
+from src.Settings import Settings
+
+# Settings is frozen, so one instance can be shared by every test
+DEFAULT_SETTINGS = Settings(duration=25, short_break=5, long_break=20, intervals=4)
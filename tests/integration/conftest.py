@@ -0,0 +1,116 @@
+"""
+Shared fixtures for integration tests.
+
+The auto-mute environment is composed from small fixtures so tests only pay
+for the pieces they use. The guild, voice channel and cog are module-scoped;
+the only state tests change on them is guild.voice_client, which
+auto_mute_environment reassigns at the start of every test.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from tests.mocks.discord_mocks import (
+    MockBot, MockInteraction, MockUser, MockGuild, MockVoiceChannel,
+    MockMember, MockVoiceState
+)
+
+from cogs import subscribe
+from cogs.subscribe import Subscribe
+
+SUBSCRIBE_PATCH_TARGETS = ('vc_manager', 'vc_accessor', 'bot_enum', 'logger')
+
+
+@pytest.fixture(scope="module")
+def automute_guild():
+    """Fixture providing the guild hosting the auto-mute session"""
+    return MockGuild(id=12345, name="AutoMute Test Guild")
+
+
+@pytest.fixture(scope="module")
+def voice_channel(automute_guild):
+    """Fixture providing the voice channel the session is connected to"""
+    return MockVoiceChannel(id=11111, name="Session Voice Channel", guild=automute_guild)
+
+
+@pytest.fixture(scope="module")
+def subscribe_cog():
+    """Fixture providing a Subscribe cog bound to a mocked bot"""
+    return Subscribe(MockBot())
+
+
+@pytest.fixture(scope="class")
+def subscribe_mocks():
+    """Fixture patching the cogs.subscribe collaborators once per test class
+
+    Class scope undoes the patches before the next class runs, so other tests
+    in the same module see the real collaborators. auto_mute_environment
+    resets the mocks between tests.
+    """
+    mocks = {name: MagicMock() for name in SUBSCRIBE_PATCH_TARGETS}
+    with pytest.MonkeyPatch.context() as mp:
+        for name, mock in mocks.items():
+            mp.setattr(subscribe, name, mock)
+        yield mocks
+
+
+@pytest.fixture
+def joining_member(automute_guild):
+    """Fixture providing the member who joins the session channel later
+
+    Function-scoped because tests replace its voice state and edit() mock.
+    """
+    return MockMember(MockUser(id=11111, name="JoiningUser"), automute_guild)
+
+
+@pytest.fixture
+def session_interaction(automute_guild, voice_channel):
+    """Fixture providing the interaction of the user who started the session"""
+    session_user = MockUser(id=67890, name="SessionUser")
+    interaction = MockInteraction(user=session_user, guild=automute_guild)
+    interaction.user.voice = MockVoiceState(
+        channel=voice_channel,
+        member=MockMember(session_user, automute_guild, voice_channel)
+    )
+    return interaction
+
+
+@pytest.fixture
+def auto_mute_environment(automute_guild, voice_channel, subscribe_cog,
+                          joining_member, session_interaction, subscribe_mocks):
+    """Fixture providing environment for auto-mute voice state testing
+
+    The cogs.subscribe collaborators are preconfigured for an active
+    work-state session with auto-mute enabled and the bot connected to the
+    session voice channel. Tests override only what their scenario changes.
+    """
+    for mock in subscribe_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    # Active session with auto-mute enabled in a work state
+    mock_session = MagicMock()
+    mock_session.ctx = session_interaction
+    mock_session.state = MagicMock()  # Work state
+    mock_auto_mute = MagicMock()
+    mock_auto_mute.all = True
+    mock_auto_mute.safe_edit_member = AsyncMock()
+    mock_session.auto_mute = mock_auto_mute
+
+    # Bot is connected to the session voice channel
+    mock_voice_client = MagicMock()
+    session_interaction.voice_client = mock_voice_client
+    automute_guild.voice_client = mock_voice_client
+
+    subscribe_mocks['vc_manager'].get_connected_session.return_value = mock_session
+    subscribe_mocks['vc_accessor'].get_voice_channel.return_value = voice_channel
+    subscribe_mocks['bot_enum'].State.WORK_STATES = [mock_session.state]
+
+    return {
+        'guild': automute_guild,
+        'voice_channel': voice_channel,
+        'session_interaction': session_interaction,
+        'joining_member': joining_member,
+        'subscribe_cog': subscribe_cog,
+        'session': mock_session,
+        'auto_mute': mock_auto_mute,
+        **subscribe_mocks,
+    }
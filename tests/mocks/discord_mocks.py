@@ -1,14 +1,33 @@
 """
 Mock Discord objects for testing without actual Discord API calls.
 """
-import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
 from typing import Optional, List, Any, Dict
 
 
+# Default channel permissions; each call returns a fresh object so a test that
+# edits one result cannot leak into other channels or tests.
+def _voice_permissions_for(_member):
+    return SimpleNamespace(
+        connect=True, speak=True, mute_members=True, administrator=True, send_messages=True
+    )
+
+
+def _text_permissions_for(_member):
+    return SimpleNamespace(
+        send_messages=True, read_messages=True, view_channel=True, mute_members=True,
+        administrator=True
+    )
+
+
 class MockUser:
     """Mock Discord User object"""
+    __slots__ = (
+        'id', 'name', 'discriminator', 'display_name', 'mention', 'avatar', 'bot',
+        'system', 'created_at', 'voice', 'send', '__weakref__'
+    )
     
     def __init__(self, id: int = 12345, name: str = "TestUser", discriminator: str = "1234"):
         self.id = id
@@ -36,6 +55,7 @@ class MockUser:
 
 class MockVoiceState:
     """Mock Discord VoiceState object"""
+    __slots__ = ('channel', 'member', 'self_mute', 'self_deaf', 'mute', 'deaf', 'afk')
     
     def __init__(self, channel=None, member=None):
         self.channel = channel
@@ -46,16 +66,45 @@ class MockVoiceState:
         self.deaf = False
         self.afk = False
 
+    @classmethod
+    def transition(cls, channel, member, *, before_channel=None, mute=False):
+        """Build a (before, after) voice state pair for a member moving into channel"""
+        before = cls(channel=before_channel, member=member)
+        after = cls(channel=channel, member=member)
+        after.mute = mute
+        return before, after
+
 
 class MockMember(MockUser):
     """Mock Discord Member object"""
+    __slots__ = (
+        'guild', 'nick', 'roles', 'joined_at', 'premium_since', 'pending', 'add_roles',
+        'remove_roles', 'edit', 'kick', 'ban'
+    )
     
     def __init__(self, user: MockUser = None, guild=None, voice_channel=None):
         if user:
             super().__init__(user.id, user.name, user.discriminator)
         else:
             super().__init__()
+        self._init_member(guild, voice_channel)
+    
+    @classmethod
+    def bulk(cls, guild, count: int, id_offset: int = 0):
+        """Build count members of guild with sequential ids starting at id_offset
         
+        Initialises the user fields directly instead of allocating a throwaway
+        MockUser per member just to copy its id.
+        """
+        members = []
+        for member_id in range(id_offset, id_offset + count):
+            member = cls.__new__(cls)
+            MockUser.__init__(member, member_id)
+            member._init_member(guild, None)
+            members.append(member)
+        return members
+    
+    def _init_member(self, guild, voice_channel):
         self.guild = guild
         self.nick = None
         self.roles = []
@@ -70,11 +119,15 @@ class MockMember(MockUser):
         self.edit = AsyncMock()
         self.kick = AsyncMock()
         self.ban = AsyncMock()
-        self.send = AsyncMock()
+        # send is already set up by MockUser.__init__
 
 
 class MockRole:
     """Mock Discord Role object"""
+    __slots__ = (
+        'id', 'name', 'position', 'color', 'hoist', 'mentionable', 'permissions',
+        'created_at'
+    )
     
     def __init__(self, id: int = 67890, name: str = "TestRole"):
         self.id = id
@@ -89,6 +142,12 @@ class MockRole:
 
 class MockVoiceChannel:
     """Mock Discord VoiceChannel object"""
+    __slots__ = (
+        'id', 'name', 'guild', 'position', 'bitrate', 'user_limit', 'members',
+        'created_at', 'permissions_for', 'connect', 'delete', 'edit',
+        # Tests attach text-in-voice helpers such as send()
+        '__dict__'
+    )
     
     def __init__(self, id: int = 11111, name: str = "Test Voice Channel", guild=None):
         self.id = id
@@ -99,7 +158,7 @@ class MockVoiceChannel:
         self.user_limit = 0
         self.members = []
         self.created_at = datetime.now()
-        self.permissions_for = MagicMock(return_value=MagicMock(connect=True, speak=True))
+        self.permissions_for = _voice_permissions_for
         
         # Mock methods
         self.connect = AsyncMock()
@@ -109,6 +168,10 @@ class MockVoiceChannel:
 
 class MockTextChannel:
     """Mock Discord TextChannel object"""
+    __slots__ = (
+        'id', 'name', 'guild', 'position', 'topic', 'slowmode_delay', 'nsfw',
+        'created_at', 'mention', 'permissions_for', 'send', 'delete', 'edit', 'purge'
+    )
     
     def __init__(self, id: int = 22222, name: str = "test-channel", guild=None):
         self.id = id
@@ -120,11 +183,7 @@ class MockTextChannel:
         self.nsfw = False
         self.created_at = datetime.now()
         self.mention = f"<#{id}>"
-        self.permissions_for = MagicMock(return_value=MagicMock(
-            send_messages=True, 
-            read_messages=True,
-            view_channel=True
-        ))
+        self.permissions_for = _text_permissions_for
         
         # Mock methods
         self.send = AsyncMock()
@@ -135,6 +194,15 @@ class MockTextChannel:
 
 class MockGuild:
     """Mock Discord Guild object"""
+    __slots__ = (
+        'id', 'name', 'description', 'icon', 'banner', 'splash', 'owner_id', 'region',
+        'afk_channel', 'afk_timeout', 'verification_level', 'default_notifications',
+        'explicit_content_filter', 'features', 'premium_tier',
+        'premium_subscription_count', 'preferred_locale', 'created_at', 'channels',
+        'voice_channels', 'text_channels', 'members', 'roles', 'me', 'voice_client',
+        'get_channel', 'get_member', 'get_role', 'fetch_member', 'ban', 'unban', 'kick',
+        'edit', '__weakref__'
+    )
     
     def __init__(self, id: int = 54321, name: str = "Test Guild"):
         self.id = id
@@ -182,6 +250,7 @@ class MockGuild:
 
 class MockInteractionResponse:
     """Mock Discord InteractionResponse object"""
+    __slots__ = ('send_message', 'defer', 'edit_message', 'delete_message', 'is_done')
     
     def __init__(self):
         self.send_message = AsyncMock()
@@ -193,6 +262,7 @@ class MockInteractionResponse:
 
 class MockWebhook:
     """Mock Discord Webhook object"""
+    __slots__ = ('send', 'edit', 'delete')
     
     def __init__(self):
         self.send = AsyncMock()
@@ -202,6 +272,7 @@ class MockWebhook:
 
 class MockFollowup:
     """Mock Discord Followup object"""
+    __slots__ = ('send', 'edit', 'delete')
     
     def __init__(self):
         self.send = AsyncMock()
@@ -211,6 +282,14 @@ class MockFollowup:
 
 class MockInteraction:
     """Mock Discord Interaction object"""
+    __slots__ = (
+        'id', 'type', 'token', 'application_id', 'user', 'guild', 'guild_id', 'channel',
+        'channel_id', 'created_at', 'command', 'locale', 'guild_locale', 'client',
+        'response', 'followup', 'edit_original_response', 'delete_original_response',
+        'original_response', 'send', '__weakref__',
+        # Tests attach ad-hoc attributes (voice_client, invoke, bot, ...)
+        '__dict__'
+    )
     
     def __init__(self, user: MockUser = None, guild: MockGuild = None, 
                  channel: MockTextChannel = None, command_name: str = "test"):
@@ -224,7 +303,8 @@ class MockInteraction:
         self.channel = channel or MockTextChannel(guild=self.guild)
         self.channel_id = self.channel.id
         self.created_at = datetime.now()
-        self.command = MagicMock(name=command_name)
+        # MagicMock(name=...) only sets the repr; expose a real .name attribute
+        self.command = SimpleNamespace(name=command_name)
         self.locale = "en-US"
         self.guild_locale = "en-US"
         
@@ -244,6 +324,12 @@ class MockInteraction:
 
 class MockMessage:
     """Mock Discord Message object"""
+    __slots__ = (
+        'id', 'author', 'channel', 'guild', 'content', 'embeds', 'attachments',
+        'pinned', 'mention_everyone', 'mentions', 'role_mentions', 'created_at',
+        'edited_at', 'edit', 'delete', 'pin', 'unpin', 'add_reaction',
+        'remove_reaction', 'clear_reactions'
+    )
     
     def __init__(self, author: MockUser = None, channel: MockTextChannel = None,
                  content: str = "Test message"):
@@ -273,6 +359,17 @@ class MockMessage:
 
 class MockBot:
     """Mock Discord Bot object"""
+    # Coroutine methods no test calls directly; created on first access
+    _LAZY_ASYNC_METHODS = (
+        'unload_extension', 'reload_extension', 'change_presence', 'wait_for',
+        'wait_until_ready'
+    )
+    __slots__ = (
+        'user', 'guilds', 'application_id', 'owner_id', 'command_prefix', 'description',
+        'intents', 'latency', 'get_guild', 'get_channel', 'get_user', 'fetch_guild',
+        'fetch_channel', 'fetch_user', 'add_cog', 'remove_cog', 'load_extension',
+        'start', 'close', 'voice_clients'
+    ) + _LAZY_ASYNC_METHODS
     
     def __init__(self):
         self.user = MockUser(id=99999, name="TestBot")
@@ -294,15 +391,16 @@ class MockBot:
         self.add_cog = AsyncMock()
         self.remove_cog = AsyncMock()
         self.load_extension = AsyncMock()
-        self.unload_extension = AsyncMock()
-        self.reload_extension = AsyncMock()
         self.start = AsyncMock()
         self.close = AsyncMock()
-        self.change_presence = AsyncMock()
-        
-        # Events
-        self.wait_for = AsyncMock()
-        self.wait_until_ready = AsyncMock()
         
         # Voice clients
-        self.voice_clients = []
\ No newline at end of file
+        self.voice_clients = []
+        
+    def __getattr__(self, name):
+        # Only reached while a lazy slot is still unset
+        if name in MockBot._LAZY_ASYNC_METHODS:
+            method = AsyncMock()
+            setattr(self, name, method)
+            return method
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
@@ -0,0 +1,35 @@
+"""
+Lightweight slot-based stand-ins for Discord objects.
+
+These carry plain attributes only, with no AsyncMock methods, for tests that
+allocate many objects and only read identifiers back (e.g. session_manager
+keying on ctx.guild.id).
+"""
+
+
+class SlimUser:
+    """Slot-based Discord User stand-in"""
+    __slots__ = ('id', 'name', '__weakref__')
+
+    def __init__(self, id: int = 12345, name: str = "TestUser"):
+        self.id = id
+        self.name = name
+
+
+class SlimGuild:
+    """Slot-based Discord Guild stand-in"""
+    __slots__ = ('id', 'name', '__weakref__')
+
+    def __init__(self, id: int = 54321, name: str = "Test Guild"):
+        self.id = id
+        self.name = name
+
+
+class SlimInteraction:
+    """Slot-based Discord Interaction stand-in"""
+    __slots__ = ('user', 'guild', 'guild_id', '__weakref__')
+
+    def __init__(self, user: SlimUser = None, guild: SlimGuild = None):
+        self.user = user or SlimUser()
+        self.guild = guild or SlimGuild()
+        self.guild_id = self.guild.id
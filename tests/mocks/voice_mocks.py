@@ -1,7 +1,6 @@
 """
 Mock Voice Client objects for testing voice functionality without actual voice connections.
 """
-import asyncio
 from unittest.mock import AsyncMock, MagicMock
 from typing import Optional
 
@@ -4,34 +4,115 @@ Tests memory leaks, resource cleanup, and system resource utilization.
 """
 import pytest
 import asyncio
+import contextlib
+import functools
 import gc
+import os
+import statistics
 import sys
 import weakref
 import time
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 from tests.mocks.discord_mocks import (
-    MockBot, MockInteraction, MockUser, MockGuild, MockVoiceChannel
+    MockBot, MockInteraction, MockUser, MockGuild, MockVoiceChannel, MockVoiceState
 )
 from tests.mocks.voice_mocks import MockVoiceClient
+from tests.mocks.slim_mocks import SlimGuild, SlimUser, SlimInteraction
 
 from src.session import session_manager
 from src.session.Session import Session
-from src.Settings import Settings
+from tests.fixtures.settings import DEFAULT_SETTINGS
 from cogs.control import Control
 from cogs.subscribe import Subscribe
 from configs.bot_enum import State
 
+# Without psutil every sample would read zero and memory assertions pass trivially
+requires_psutil = pytest.mark.skipif(psutil is None, reason="psutil is required to measure memory")
+
+# Classes whose live instances get_object_count_by_type can report
+TRACKED_TYPES = (Session, MockUser, MockGuild, MockInteraction)
+
+
+def _tracking_init(original_init, instances):
+    """Wrap __init__ so every constructed instance is registered by id"""
+    @functools.wraps(original_init)
+    def __init__(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        instances[id(self)] = self
+    return __init__
+
+
+@contextlib.contextmanager
+def _patch_session_internals():
+    """Patch out the timer, stats and subscriptions a Session builds on init"""
+    with contextlib.ExitStack() as stack:
+        for target in (
+            'src.session.Session.Timer',
+            'src.session.Session.Stats',
+            'src.subscriptions.Subscription.Subscription',
+            'src.subscriptions.AutoMute.AutoMute',
+        ):
+            stack.enter_context(patch(target))
+        yield
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+class _StubSettings:
+    """Attribute-less Settings stand-in that accepts any values"""
+    __slots__ = ()
+
+    def __init__(self, *args):
+        pass
+
+    @staticmethod
+    async def is_valid_interaction(*args):
+        return True
+
+
+class _StubSession:
+    """Slotted Session stand-in; the command only hands it to the controller"""
+    __slots__ = ('ctx',)
+
+    def __init__(self, state, settings, ctx):
+        self.ctx = ctx
+
 
 class TestMemoryUsage:
     """Performance tests for memory usage and resource management"""
     
+    # psutil.Process for this test run, created on first sample
+    _proc = None
+    
     def setup_method(self):
         """Reset session state and force garbage collection"""
         session_manager.active_sessions.clear()
         session_manager.session_locks.clear()
         gc.collect()
     
+    @pytest.fixture(autouse=True)
+    def instance_registry(self, monkeypatch):
+        """Fixture registering instances of TRACKED_TYPES in per-class weak maps
+        
+        Counting live objects then costs len() instead of a gc.get_objects()
+        walk over the whole heap. Entries are keyed by id() because MockUser
+        defines __eq__ without __hash__.
+        """
+        self._instances = {}
+        for cls in TRACKED_TYPES:
+            instances = self._instances[cls] = weakref.WeakValueDictionary()
+            monkeypatch.setattr(cls, '__init__', _tracking_init(cls.__init__, instances))
+        return self._instances
+    
     @pytest.fixture
     def memory_test_environment(self):
         """Fixture providing environment for memory testing"""
@@ -41,8 +122,7 @@ class TestMemoryUsage:
         user = MockUser(id=67890, name="MemoryTestUser")
         interaction = MockInteraction(user=user, guild=guild)
         
-        interaction.user.voice = MagicMock()
-        interaction.user.voice.channel = voice_channel
+        interaction.user.voice = MockVoiceState(channel=voice_channel)
         
         control_cog = Control(bot)
         subscribe_cog = Subscribe(bot)
@@ -58,109 +138,96 @@ class TestMemoryUsage:
         }
     
     def get_memory_info(self):
-        """Get current memory usage information"""
-        try:
-            import psutil
-            import os
-            process = psutil.Process(os.getpid())
-            memory_info = process.memory_info()
-            return {
-                'rss': memory_info.rss / 1024 / 1024,  # MB
-                'vms': memory_info.vms / 1024 / 1024,  # MB
-                'percent': process.memory_percent()
-            }
-        except ImportError:
-            # Fallback if psutil not available
-            return {
-                'rss': 0,
-                'vms': 0, 
-                'percent': 0
-            }
+        """Get current memory usage information (tests calling this need @requires_psutil)"""
+        if TestMemoryUsage._proc is None:
+            TestMemoryUsage._proc = psutil.Process(os.getpid())
+        # USS is memory unique to this process, so shared library paging
+        # does not show up as growth; PSS is Linux-only
+        memory_info = TestMemoryUsage._proc.memory_full_info()
+        return {
+            'rss': memory_info.rss / 1024 / 1024,  # MB
+            'pss': getattr(memory_info, 'pss', memory_info.uss) / 1024 / 1024,  # MB
+            'uss': memory_info.uss / 1024 / 1024  # MB
+        }
+    
+    def assert_no_memory_trend(self, samples, every, max_kb_per_iter, label):
+        """Fail if USS samples taken every `every` iterations trend upwards
+        
+        A least-squares slope separates a steady leak from one-off growth
+        (warm-up, arena reuse) that a fixed MB ceiling would also trip on.
+        The first window absorbs lazy imports and caches, so the fit starts
+        at the end of it.
+        """
+        samples = samples[1:]
+        slope, _ = statistics.linear_regression(range(len(samples)), samples)
+        kb_per_iter = slope * 1024 / every
+        assert kb_per_iter < max_kb_per_iter, f"{label}: USS trending up by {kb_per_iter:.2f} KB per iteration"
     
     def get_object_count_by_type(self, obj_type):
-        """Count objects of a specific type in memory"""
+        """Count live objects of a tracked type created during this test"""
         gc.collect()
-        return len([obj for obj in gc.get_objects() if isinstance(obj, obj_type)])
+        return len(self._instances[obj_type])
     
     @pytest.mark.asyncio
     @pytest.mark.slow
+    @requires_psutil
     async def test_session_memory_leak_detection(self, memory_test_environment):
         """Test for memory leaks in session creation and destruction"""
         env = memory_test_environment
         
-        # Baseline memory measurement
-        initial_memory = self.get_memory_info()
-        initial_session_count = self.get_object_count_by_type(Session)
-        
-        weak_refs = []
+        # USS sampled every 10 sessions
+        uss_samples = [self.get_memory_info()['uss']]
         
-        with patch('src.session.Session.Timer'), \
-             patch('src.session.Session.Stats'), \
-             patch('src.subscriptions.Subscription.Subscription'), \
-             patch('src.subscriptions.AutoMute.AutoMute'):
+        with _patch_session_internals():
             
-            # Create and destroy many sessions
-            for cycle in range(100):
-                # Create session
-                guild = MockGuild(id=10000 + cycle, name=f"MemLeakGuild{cycle}")
-                user = MockUser(id=20000 + cycle, name=f"MemLeakUser{cycle}")
-                interaction = MockInteraction(user=user, guild=guild)
-                
-                settings = Settings(duration=25, short_break=5, long_break=20, intervals=4)
-                session = Session(State.POMODORO, settings, interaction)
-                
-                # Create weak reference to track cleanup
-                weak_refs.append(weakref.ref(session))
+            # Reuse a small pool of contexts; only the guild id has to be unique
+            mock_pool = [
+                SlimInteraction(user=SlimUser(name="MemLeakUser"), guild=SlimGuild(name="MemLeakGuild"))
+                for _ in range(5)
+            ]
+            
+            # Create and destroy many sessions, one pool-sized batch at a time
+            for batch_start in range(0, 100, len(mock_pool)):
+                # Create sessions
+                sessions = []
+                for offset, interaction in enumerate(mock_pool):
+                    cycle = batch_start + offset
+                    interaction.guild.id = interaction.guild_id = 10000 + cycle
+                    interaction.user.id = 20000 + cycle
+                    sessions.append(Session(State.POMODORO, DEFAULT_SETTINGS, interaction))
                 
-                # Activate and use session
-                await session_manager.activate(session)
+                # Activate and use sessions
+                await asyncio.gather(*(session_manager.activate(s) for s in sessions))
                 
                 # Simulate session usage
-                session.state = State.SHORT_BREAK
-                retrieved = await session_manager.get_session(interaction)
-                assert retrieved == session
+                for session in sessions:
+                    session.state = State.SHORT_BREAK
+                retrieved = await asyncio.gather(*(session_manager.get_session(s.ctx) for s in sessions))
+                assert all(r is s for r, s in zip(retrieved, sessions))
                 
-                # Deactivate session
-                await session_manager.deactivate(session)
+                # Deactivate sessions
+                await asyncio.gather(*(session_manager.deactivate(s) for s in sessions))
                 
-                # Delete local reference
+                # Break the session -> interaction edge so refcounting can free the batch
+                for session in sessions:
+                    session.ctx = None
+                    session.settings = None
+                
+                # Delete local references
+                del sessions
                 del session
-                del interaction
-                del user
-                del guild
-                del settings
+                del retrieved
                 
-                # Force garbage collection every 20 cycles
-                if cycle % 20 == 0:
-                    gc.collect()
+                if (batch_start + len(mock_pool)) % 10 == 0:
+                    uss_samples.append(self.get_memory_info()['uss'])
         
-        # Final cleanup and measurement
-        gc.collect()
-        final_memory = self.get_memory_info()
-        final_session_count = self.get_object_count_by_type(Session)
-        
-        # Check weak references - they should all be None if objects were collected
-        dead_refs = sum(1 for ref in weak_refs if ref() is None)
-        alive_refs = len(weak_refs) - dead_refs
-        
-        # Memory assertions
-        memory_growth = final_memory['rss'] - initial_memory['rss']
-        session_count_growth = final_session_count - initial_session_count
-        
-        # Allow for some memory growth but detect major leaks
-        # Note: In test environment with mocked objects, some retention is expected
-        # This test is mainly for catching significant memory leaks, not perfect cleanup
-        assert memory_growth < 200, f"Excessive memory growth: {memory_growth:.2f} MB"
-        
-        # In test environment, perfect cleanup may not occur due to mocking
-        # Check that we don't have significantly more objects than created
-        assert session_count_growth <= 100, f"Session objects leaked beyond creation count: {session_count_growth} (created 100)"
-        
-        # Check weak references - allow for test environment retention
-        cleanup_ratio = dead_refs / len(weak_refs) if weak_refs else 0
-        # In test environment with mocked objects, perfect cleanup may not occur
-        # Adjust expectations to be more realistic for test environment
-        assert cleanup_ratio > 0.05 or alive_refs <= 100, f"Poor cleanup ratio: {cleanup_ratio:.2%}, alive refs: {alive_refs}"
+        # Memory must not keep climbing from one window to the next
+        self.assert_no_memory_trend(uss_samples, 10, 25, "Session create/destroy")
+        
+        # Nothing outside the loop holds a session, so at most 5% of the 100
+        # created may survive (the registry only sees this test's sessions)
+        live_sessions = self.get_object_count_by_type(Session)
+        assert live_sessions <= 5, f"Sessions survived cleanup: {live_sessions} of 100"
     
     @pytest.mark.asyncio
     @pytest.mark.slow
@@ -171,27 +238,21 @@ class TestMemoryUsage:
         initial_active_sessions = len(session_manager.active_sessions)
         initial_session_locks = len(session_manager.session_locks)
         
-        with patch('src.session.Session.Timer'), \
-             patch('src.session.Session.Stats'), \
-             patch('src.subscriptions.Subscription.Subscription'), \
-             patch('src.subscriptions.AutoMute.AutoMute'):
-            
-            sessions_to_track = []
+        with _patch_session_internals():
             
             # Create multiple sessions
+            sessions = []
             for i in range(50):
                 guild = MockGuild(id=30000 + i, name=f"CleanupGuild{i}")
                 user = MockUser(id=40000 + i, name=f"CleanupUser{i}")
                 interaction = MockInteraction(user=user, guild=guild)
-                
-                settings = Settings(duration=25, short_break=5, long_break=20, intervals=4)
-                session = Session(State.POMODORO, settings, interaction)
-                
-                await session_manager.activate(session)
-                sessions_to_track.append((session, weakref.ref(session)))
-                
-                # Verify session is tracked
-                guild_id = session_manager.session_id_from(interaction)
+                sessions.append(Session(State.POMODORO, DEFAULT_SETTINGS, interaction))
+            
+            await asyncio.gather(*(session_manager.activate(s) for s in sessions))
+            
+            # Verify sessions are tracked
+            for session in sessions:
+                guild_id = session_manager.session_id_from(session.ctx)
                 assert guild_id in session_manager.active_sessions
                 assert guild_id in session_manager.session_locks
             
@@ -200,15 +261,16 @@ class TestMemoryUsage:
             assert len(session_manager.session_locks) >= initial_session_locks + 50
             
             # Cleanup all sessions
-            for session, weak_ref in sessions_to_track:
-                await session_manager.deactivate(session)
-                
-                # Verify session was removed from tracking
+            await asyncio.gather(*(session_manager.deactivate(s) for s in sessions))
+            
+            # Verify sessions were removed from tracking
+            for session in sessions:
                 guild_id = session_manager.session_id_from(session.ctx)
                 assert guild_id not in session_manager.active_sessions
             
             # Clean up local references
-            del sessions_to_track
+            del sessions
+            del session
             gc.collect()
             
             # Verify complete cleanup
@@ -216,68 +278,60 @@ class TestMemoryUsage:
     
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_cog_command_memory_usage(self, memory_test_environment):
+    @requires_psutil
+    async def test_cog_command_memory_usage(self, memory_test_environment, monkeypatch):
         """Test memory usage of cog commands under repeated execution"""
         env = memory_test_environment
         
-        initial_memory = self.get_memory_info()
-        
-        with patch('cogs.control.Settings') as mock_settings, \
-             patch('cogs.control.session_controller') as mock_controller, \
-             patch('cogs.control.Session') as mock_session_class, \
-             patch('cogs.control.voice_validation') as mock_voice_validation, \
-             patch('cogs.control.session_manager') as mock_session_manager:
-            
-            # Setup mocks
-            mock_settings.is_valid_interaction = AsyncMock(return_value=True)
-            mock_voice_validation.can_connect.return_value = True
-            mock_voice_validation.is_voice_alone.return_value = True
-            mock_session_manager.active_sessions = {}
-            mock_session_manager.session_id_from.return_value = "test_session_id"
-            mock_controller.start_pomodoro = AsyncMock()
-            
-            # Execute many command calls
-            for iteration in range(500):
-                # Create fresh interaction each time
-                user = MockUser(id=50000 + iteration, name=f"CmdUser{iteration}")
-                guild = MockGuild(id=60000 + iteration, name=f"CmdGuild{iteration}")
-                interaction = MockInteraction(user=user, guild=guild)
-                interaction.user.voice = MagicMock()
-                interaction.user.voice.channel = env['voice_channel']
-                
-                # Create mock session
-                mock_session = MagicMock()
-                mock_session.ctx = interaction
-                mock_session_class.return_value = mock_session
-                
-                # Execute pomodoro command
-                await env['control_cog'].pomodoro.callback(
-                    env['control_cog'],
-                    interaction,
-                    pomodoro=25,
-                    short_break=5,
-                    long_break=20,
-                    intervals=4
-                )
-                
-                # Clean up local references
-                del interaction
-                del user
-                del guild
-                del mock_session
-                
-                # Periodic garbage collection
-                if iteration % 100 == 0:
-                    gc.collect()
+        # USS sampled every 50 commands
+        uss_samples = [self.get_memory_info()['uss']]
+        
+        # Plain stubs record nothing, so repeated calls do not grow the heap
+        mock_controller = SimpleNamespace(start_pomodoro=_noop)
+        mock_voice_validation = MagicMock()
+        mock_voice_validation.can_connect.return_value = True
+        mock_voice_validation.is_voice_alone.return_value = True
+        mock_session_manager = SimpleNamespace(
+            active_sessions={},
+            session_id_from=lambda ctx: "test_session_id"
+        )
+        
+        monkeypatch.setattr('cogs.control.Settings', _StubSettings)
+        monkeypatch.setattr('cogs.control.session_controller', mock_controller)
+        monkeypatch.setattr('cogs.control.Session', _StubSession)
+        monkeypatch.setattr('cogs.control.voice_validation', mock_voice_validation)
+        monkeypatch.setattr('cogs.control.session_manager', mock_session_manager)
+        
+        # Every caller sits in the same voice channel
+        voice_state = MockVoiceState(channel=env['voice_channel'])
+        
+        # Recycle a small pool of interactions; only the ids have to vary
+        interaction_pool = []
+        for _ in range(16):
+            interaction = MockInteraction(user=MockUser(id=0, name="CmdUser"), guild=MockGuild(id=0, name="CmdGuild"))
+            interaction.user.voice = voice_state
+            interaction_pool.append(interaction)
+        
+        # Execute many command calls
+        for iteration in range(500):
+            interaction = interaction_pool[iteration & 15]
+            interaction.user.id = 50000 + iteration
+            interaction.guild.id = interaction.guild_id = 60000 + iteration
             
-            # Final memory check
-            gc.collect()
-            final_memory = self.get_memory_info()
-            memory_growth = final_memory['rss'] - initial_memory['rss']
+            # Execute pomodoro command
+            await env['control_cog'].pomodoro.callback(
+                env['control_cog'],
+                interaction,
+                pomodoro=25,
+                short_break=5,
+                long_break=20,
+                intervals=4
+            )
             
-            # Memory growth should be reasonable for 500 command executions
-            # In test environment with extensive mocking and logging, higher growth is expected
-            assert memory_growth < 500, f"Excessive memory growth in commands: {memory_growth:.2f} MB"
+            if (iteration + 1) % 50 == 0:
+                uss_samples.append(self.get_memory_info()['uss'])
+        
+        self.assert_no_memory_trend(uss_samples, 50, 10, "Command execution")
     
     @pytest.mark.asyncio
     async def test_voice_client_resource_cleanup(self, memory_test_environment):
@@ -322,20 +376,19 @@ class TestMemoryUsage:
     
     @pytest.mark.asyncio
     @pytest.mark.slow
+    @requires_psutil
     async def test_high_frequency_session_operations(self, memory_test_environment):
         """Test memory usage under high-frequency session operations"""
         env = memory_test_environment
         
-        initial_memory = self.get_memory_info()
+        # USS sampled every 50 operations
+        uss_samples = [self.get_memory_info()['uss']]
         operation_count = 1000
         
-        with patch('src.session.Session.Timer'), \
-             patch('src.session.Session.Stats'), \
-             patch('src.subscriptions.Subscription.Subscription'), \
-             patch('src.subscriptions.AutoMute.AutoMute'):
+        with _patch_session_internals():
             
             # Create one session for repeated operations
-            settings = Settings(duration=25, short_break=5, long_break=20, intervals=4)
+            settings = DEFAULT_SETTINGS
             session = Session(State.POMODORO, settings, env['interaction'])
             
             # Perform many rapid operations
@@ -348,81 +401,78 @@ class TestMemoryUsage:
                 
                 # Retrieve session
                 retrieved = await session_manager.get_session(env['interaction'])
-                assert retrieved == session
+                assert retrieved is session
                 
                 # Deactivate session
                 await session_manager.deactivate(session)
                 
-                # Periodic garbage collection
-                if operation % 200 == 0:
-                    gc.collect()
-            
-            # Final cleanup
-            del session
-            gc.collect()
+                if (operation + 1) % 50 == 0:
+                    uss_samples.append(self.get_memory_info()['uss'])
             
-            final_memory = self.get_memory_info()
-            memory_growth = final_memory['rss'] - initial_memory['rss']
-            
-            # Memory should remain stable despite high operation frequency
-            assert memory_growth < 25, f"Memory grew too much under load: {memory_growth:.2f} MB"
+            # Memory should remain flat despite high operation frequency
+            self.assert_no_memory_trend(uss_samples, 50, 5, "High-frequency operations")
     
     @pytest.mark.asyncio
-    async def test_auto_mute_memory_usage(self, memory_test_environment):
+    @requires_psutil
+    async def test_auto_mute_memory_usage(self, memory_test_environment, monkeypatch):
         """Test memory usage of auto-mute functionality"""
         env = memory_test_environment
         
-        initial_memory = self.get_memory_info()
-        
-        with patch('cogs.subscribe.session_manager') as mock_session_manager, \
-             patch('cogs.subscribe.vc_accessor') as mock_vc_accessor, \
-             patch('cogs.subscribe.voice_validation') as mock_voice_validation:
-            
-            # Create mock session with auto_mute
-            mock_session = MagicMock()
-            mock_session.ctx = env['interaction']
-            mock_session.auto_mute = MagicMock()
-            mock_session.auto_mute.all = False
-            mock_session.auto_mute.handle_all = AsyncMock()
-            
-            mock_session_manager.get_session_interaction = AsyncMock(return_value=mock_session)
-            mock_vc_accessor.get_voice_channel_interaction.return_value = env['voice_channel']
-            mock_vc_accessor.get_voice_channel.return_value = env['voice_channel']
-            mock_voice_validation.require_same_voice_channel = AsyncMock(return_value=True)
+        # USS sampled every 25 operations
+        uss_samples = [self.get_memory_info()['uss']]
+        
+        # Session in a work state whose auto-mute toggling is a no-op
+        mock_session = SimpleNamespace(
+            ctx=env['interaction'],
+            state=State.POMODORO,
+            auto_mute=SimpleNamespace(all=False, handle_all=_noop)
+        )
+        
+        async def get_session_interaction(interaction):
+            return mock_session
+        
+        async def require_same_voice_channel(interaction):
+            return True
+        
+        monkeypatch.setattr('cogs.subscribe.session_manager', SimpleNamespace(
+            get_session_interaction=get_session_interaction
+        ))
+        monkeypatch.setattr('cogs.subscribe.vc_accessor', SimpleNamespace(
+            get_voice_channel_interaction=lambda interaction: env['voice_channel'],
+            get_voice_channel=lambda ctx: env['voice_channel']
+        ))
+        monkeypatch.setattr('cogs.subscribe.voice_validation', SimpleNamespace(
+            require_same_voice_channel=require_same_voice_channel
+        ))
+        
+        # Recycle a small pool of interactions; only the user id has to vary
+        interaction_pool = [
+            MockInteraction(user=MockUser(id=0, name="AutoMuteUser"), guild=env['guild'])
+            for _ in range(16)
+        ]
+        
+        # Perform many auto-mute operations
+        for operation in range(200):
+            interaction = interaction_pool[operation & 15]
+            interaction.user.id = 70000 + operation
+            mock_session.ctx = interaction
             
-            # Perform many auto-mute operations
-            for operation in range(200):
-                # Create new interaction each time
-                user = MockUser(id=70000 + operation, name=f"AutoMuteUser{operation}")
-                interaction = MockInteraction(user=user, guild=env['guild'])
-                mock_session.ctx = interaction
-                
-                # Execute auto-mute commands
-                await env['subscribe_cog'].enableautomute.callback(env['subscribe_cog'], interaction)
-                await env['subscribe_cog'].disableautomute.callback(env['subscribe_cog'], interaction)
-                
-                # Clean up
-                del interaction
-                del user
-                
-                if operation % 50 == 0:
-                    gc.collect()
+            # Execute auto-mute commands
+            await env['subscribe_cog'].enableautomute.callback(env['subscribe_cog'], interaction)
+            await env['subscribe_cog'].disableautomute.callback(env['subscribe_cog'], interaction)
             
-            final_memory = self.get_memory_info()
-            memory_growth = final_memory['rss'] - initial_memory['rss']
-            
-            assert memory_growth < 20, f"Auto-mute operations caused memory growth: {memory_growth:.2f} MB"
+            if (operation + 1) % 25 == 0:
+                uss_samples.append(self.get_memory_info()['uss'])
+        
+        self.assert_no_memory_trend(uss_samples, 25, 20, "Auto-mute operations")
     
     @pytest.mark.asyncio
     async def test_discord_mock_object_cleanup(self, memory_test_environment):
         """Test cleanup of Discord mock objects"""
         env = memory_test_environment
         
-        from tests.mocks.discord_mocks import MockUser, MockGuild, MockInteraction
-        
-        initial_user_count = self.get_object_count_by_type(MockUser)
-        initial_guild_count = self.get_object_count_by_type(MockGuild)
-        initial_interaction_count = self.get_object_count_by_type(MockInteraction)
+        mock_types = (MockUser, MockGuild, MockInteraction)
+        ids_before = {cls: set(self._instances[cls].keys()) for cls in mock_types}
         
         mock_objects = []
         
@@ -440,24 +490,18 @@ class TestMemoryUsage:
         
         # Clear local references
         del mock_objects
+        del user, guild, interaction
         gc.collect()
         
-        final_user_count = self.get_object_count_by_type(MockUser)
-        final_guild_count = self.get_object_count_by_type(MockGuild)
-        final_interaction_count = self.get_object_count_by_type(MockInteraction)
-        
-        # Check object count growth
-        user_growth = final_user_count - initial_user_count
-        guild_growth = final_guild_count - initial_guild_count
-        interaction_growth = final_interaction_count - initial_interaction_count
-        
-        # Allow some objects to remain but detect major leaks
-        assert user_growth < 20, f"Too many MockUser objects remaining: {user_growth}"
-        assert guild_growth < 20, f"Too many MockGuild objects remaining: {guild_growth}"
-        assert interaction_growth < 20, f"Too many MockInteraction objects remaining: {interaction_growth}"
+        # Every object created above must be gone: survivors are exactly the
+        # registered ids that were not live beforehand
+        for cls in mock_types:
+            leaked = set(self._instances[cls].keys()) - ids_before[cls]
+            assert not leaked, f"{cls.__name__} objects remaining: {len(leaked)}"
     
     @pytest.mark.asyncio
     @pytest.mark.slow
+    @requires_psutil
     async def test_system_resource_limits(self, memory_test_environment):
         """Test system behavior near resource limits"""
         env = memory_test_environment
@@ -468,35 +512,32 @@ class TestMemoryUsage:
         
         sessions_created = 0
         
-        with patch('src.session.Session.Timer'), \
-             patch('src.session.Session.Stats'), \
-             patch('src.subscriptions.Subscription.Subscription'), \
-             patch('src.subscriptions.AutoMute.AutoMute'):
+        with _patch_session_internals():
             
             try:
-                # Create many sessions until we hit limits or complete
-                for i in range(max_sessions):
-                    guild = MockGuild(id=100000 + i, name=f"LimitGuild{i}")
-                    user = MockUser(id=110000 + i, name=f"LimitUser{i}")
-                    interaction = MockInteraction(user=user, guild=guild)
+                # Create many sessions in batches until we hit limits or complete
+                batch_size = 100
+                for batch_start in range(0, max_sessions, batch_size):
+                    # Sessions stay active across batches, so each one gets its
+                    # own slim context; a recycled one would change its guild id
+                    batch = [
+                        Session(State.POMODORO, DEFAULT_SETTINGS, SlimInteraction(
+                            user=SlimUser(id=110000 + i, name="LimitUser"),
+                            guild=SlimGuild(id=100000 + i, name="LimitGuild")
+                        ))
+                        for i in range(batch_start, batch_start + batch_size)
+                    ]
                     
-                    settings = Settings(duration=25, short_break=5, long_break=20, intervals=4)
-                    session = Session(State.POMODORO, settings, interaction)
+                    await asyncio.gather(*(session_manager.activate(s) for s in batch))
+                    sessions_created += len(batch)
                     
-                    await session_manager.activate(session)
-                    sessions_created += 1
+                    # Check memory usage after each batch
+                    current_memory = self.get_memory_info()
+                    memory_growth = current_memory['uss'] - initial_memory['uss']
                     
-                    # Check memory usage periodically
-                    if i % 100 == 0:
-                        current_memory = self.get_memory_info()
-                        memory_growth = current_memory['rss'] - initial_memory['rss']
-                        
-                        # Stop if memory usage becomes excessive
-                        if memory_growth > 500:  # 500 MB limit
-                            break
-                        
-                        # Yield control periodically
-                        await asyncio.sleep(0.001)
+                    # Stop if memory usage becomes excessive
+                    if memory_growth > 500:  # 500 MB limit
+                        break
             
             except (MemoryError, OSError):
                 # Expected when hitting system limits
@@ -504,6 +545,12 @@ class TestMemoryUsage:
             
             # Verify we created a reasonable number of sessions
             assert sessions_created > 50, f"Should be able to create at least 50 sessions, created {sessions_created}"
+            # Every active session is still keyed by its own guild id
+            assert len(session_manager.active_sessions) == sessions_created
+            assert all(
+                session_manager.session_id_from(s.ctx) == guild_id
+                for guild_id, s in session_manager.active_sessions.items()
+            )
             
             # Cleanup
             session_manager.active_sessions.clear()
@@ -515,8 +562,6 @@ class TestMemoryUsage:
         """Test proper cleanup of async tasks and coroutines"""
         env = memory_test_environment
         
-        tasks_created = []
-        
         async def mock_long_running_task():
             """Mock long-running task that might not complete"""
             try:
@@ -525,23 +570,19 @@ class TestMemoryUsage:
             except asyncio.CancelledError:
                 return "cancelled"
         
-        # Create many tasks
-        for i in range(50):
-            task = asyncio.create_task(mock_long_running_task())
-            tasks_created.append(task)
-        
-        # Wait briefly then cancel all tasks
-        await asyncio.sleep(0.01)
-        
-        for task in tasks_created:
-            if not task.done():
+        # The group waits for every task to finish before the block exits
+        async with asyncio.TaskGroup() as tg:
+            tasks_created = [tg.create_task(mock_long_running_task()) for _ in range(50)]
+            
+            # A single yield lets every task park on its sleep
+            await asyncio.sleep(0)
+            
+            for task in tasks_created:
                 task.cancel()
         
-        # Wait for cancellation to complete
-        cancelled_tasks = await asyncio.gather(*tasks_created, return_exceptions=True)
-        
         # Verify all tasks were handled
-        assert len(cancelled_tasks) == 50
+        cancelled_tasks = [task.result() for task in tasks_created]
+        assert cancelled_tasks == ["cancelled"] * 50
         
         # Check that tasks are properly cleaned up
         completed_count = sum(1 for task in tasks_created if task.done())
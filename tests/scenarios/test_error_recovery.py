@@ -2,395 +2,416 @@
 Scenario tests for error recovery and fault tolerance.
 Tests system behavior when errors occur and recovery mechanisms.
 """
+import copy
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
-from discord.errors import DiscordException, HTTPException, ConnectionClosed
+from contextlib import ExitStack, suppress
+from operator import attrgetter
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
+from discord import app_commands
+from discord.errors import DiscordException, HTTPException
 
 from tests.mocks.discord_mocks import (
-    MockBot, MockInteraction, MockUser, MockGuild, MockVoiceChannel
+    MockBot, MockInteraction, MockUser, MockGuild, MockVoiceChannel,
+    MockTextChannel, MockInteractionResponse, MockFollowup
 )
-from tests.mocks.voice_mocks import MockVoiceClient
 
 from cogs.control import Control
 from cogs.subscribe import Subscribe
-from src.session import session_manager
+from src.session import session_manager, session_controller
 from src.session.Session import Session
-from src.Settings import Settings
+from src.Timer import Timer
+from tests.fixtures.settings import DEFAULT_SETTINGS
 from configs.bot_enum import State
 
+# Tests share module-scoped patches; under `pytest -n auto --dist loadgroup`
+# keep them on one worker so those patches are installed only once
+pytestmark = pytest.mark.xdist_group("error_recovery")
 
+# Discord errors built once; each is raised or handled by a single test,
+# so no traceback accumulates on the shared instances
+_HTTP_ERR = HTTPException(response=MagicMock(status=500, reason="Internal Server Error"), message="API Error")
+_VOICE_ERR = DiscordException("Voice connection failed")
+_CMD_ERR = app_commands.CommandInvokeError(MagicMock(), Exception("Test error"))
+
+
+def assert_error_logged(logger, with_details=False):
+    """Assert the logger mock recorded an error, and with_details a logger.exception traceback too"""
+    assert logger.error.called, "expected logger.error to be called"
+    if with_details:
+        assert logger.exception.called, "expected logger.exception to be called"
+
+
+def _patch_names(stack, module, names):
+    """Patch all names in module with one patch.multiple and collect the mocks in a namespace"""
+    return SimpleNamespace(**stack.enter_context(
+        patch.multiple(module, **dict.fromkeys(names, DEFAULT))
+    ))
+
+
+@pytest.fixture(scope="module")
+def recovery_mocks():
+    """Fixture installing the collaborator patches once for the whole module
+    
+    Mocks are grouped by the module they replace names in, since several
+    names (logger, session_manager, ...) are patched in more than one place.
+    The pool group holds unpatched AsyncMocks that tests attach to their own
+    stand-ins, so those are not rebuilt per test either.
+    """
+    with ExitStack() as stack:
+        mocks = SimpleNamespace(
+            control=_patch_names(stack, 'cogs.control', (
+                'Settings', 'session_controller', 'Session', 'session_manager',
+                'voice_validation', 'logger', 'u_msg'
+            )),
+            controller=_patch_names(stack, 'src.session.session_controller', (
+                'vc_manager', 'session_manager', 'session_messenger', 'logger',
+                'run_interval', 'state_handler', 'countdown'
+            )),
+            subscribe=_patch_names(stack, 'cogs.subscribe', (
+                'session_manager', 'vc_accessor', 'voice_validation', 'logger', 'u_msg'
+            )),
+            pool=SimpleNamespace(handle_all=AsyncMock())
+        )
+        mocks.control.Settings.is_valid_interaction = AsyncMock()
+        mocks.control.session_controller.start_pomodoro = AsyncMock()
+        mocks.control.session_manager.get_session_interaction = AsyncMock()
+        # Pure function of the interaction: use the real one, not a mock wrapping it
+        mocks.control.session_manager.session_id_from = session_manager.session_id_from
+        mocks.control.voice_validation.require_same_voice_channel = AsyncMock()
+        mocks.controller.vc_manager.connect = AsyncMock()
+        mocks.controller.session_manager.activate = AsyncMock()
+        mocks.controller.session_messenger.send_pomodoro_msg = AsyncMock()
+        mocks.controller.state_handler.auto_mute = AsyncMock()
+        mocks.subscribe.session_manager.get_session_interaction = AsyncMock()
+        mocks.subscribe.voice_validation.require_same_voice_channel = AsyncMock()
+        yield mocks
+
+
+def _clone_interaction(prototype):
+    """Shallow-copy an interaction, giving it fresh mocks for everything tests assert on"""
+    interaction = copy.copy(prototype)
+    interaction.channel = MockTextChannel(guild=prototype.guild)
+    interaction.response = MockInteractionResponse()
+    interaction.followup = MockFollowup()
+    interaction.edit_original_response = AsyncMock()
+    interaction.delete_original_response = AsyncMock()
+    return interaction
+
+
+@pytest.fixture(scope="module")
+def _env_prototype():
+    """Fixture building the bot, guild, cogs and interaction once per module"""
+    bot = MockBot()
+    guild = MockGuild(id=12345, name="Test Guild")
+    voice_channel = MockVoiceChannel(guild=guild)
+    user = MockUser(id=67890, name="TestUser")
+    interaction = MockInteraction(user=user, guild=guild)
+    
+    interaction.user.voice = MagicMock()
+    interaction.user.voice.channel = voice_channel
+    
+    return {
+        'bot': bot,
+        'guild': guild,
+        'voice_channel': voice_channel,
+        'user': user,
+        'interaction': interaction,
+        'control_cog': Control(bot),
+        'subscribe_cog': Subscribe(bot)
+    }
+
+
+@pytest.fixture
+def session_deps():
+    """Fixture patching the collaborators a real Session builds in its constructor"""
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            Timer=stack.enter_context(patch('src.session.Session.Timer')),
+            Stats=stack.enter_context(patch('src.session.Session.Stats')),
+            Subscription=stack.enter_context(patch('src.subscriptions.Subscription.Subscription')),
+            AutoMute=stack.enter_context(patch('src.subscriptions.AutoMute.AutoMute'))
+        )
+
+
+@pytest.fixture(scope="module")
+def default_settings():
+    """Fixture providing the shared DEFAULT_SETTINGS; Settings is frozen, so sharing is safe"""
+    return DEFAULT_SETTINGS
+
+
+@pytest.fixture(scope="module")
+def session_spec(default_settings, _env_prototype):
+    """Fixture providing a real Session to spec stand-ins on
+    
+    Session sets its attributes in __init__, so speccing on the class would
+    reject ctx, stats, timer, ...; an instance carries them.
+    """
+    return Session(State.POMODORO, default_settings, _env_prototype['interaction'])
+
+
+@pytest.mark.asyncio(scope="class")
 class TestErrorRecovery:
-    """Scenario tests for error recovery mechanisms"""
+    """Scenario tests for error recovery mechanisms
+    
+    Every test awaits mocks only, so they all run on one class-scoped event
+    loop instead of creating and closing a loop per test.
+    """
     
-    def setup_method(self):
-        """Reset session state before each test"""
-        session_manager.active_sessions.clear()
-        session_manager.session_locks.clear()
+    @pytest.fixture(autouse=True)
+    def reset_session_state(self):
+        """Give each test empty session state, and leave none behind even if it fails
+        
+        The dicts are swapped rather than cleared so nothing still holding the
+        old one sees it emptied underneath it.
+        """
+        session_manager.active_sessions = {}
+        session_manager.session_locks = {}
+        yield
+        session_manager.active_sessions = {}
+        session_manager.session_locks = {}
+    
+    @pytest.fixture(autouse=True)
+    def patched(self, recovery_mocks, reset_session_state):
+        """Point the shared mocks at this test's session dict, then reset them after the test"""
+        recovery_mocks.control.session_manager.active_sessions = session_manager.active_sessions
+        yield recovery_mocks
+        
+        # Drop per-test return values, side effects and call history
+        for group in vars(recovery_mocks).values():
+            for mock in vars(group).values():
+                mock.reset_mock(return_value=True, side_effect=True)
     
     @pytest.fixture
-    def error_test_environment(self):
-        """Fixture providing environment for error testing"""
-        bot = MockBot()
-        guild = MockGuild(id=12345, name="Test Guild")
-        voice_channel = MockVoiceChannel(guild=guild)
-        user = MockUser(id=67890, name="TestUser")
-        interaction = MockInteraction(user=user, guild=guild)
-        
-        interaction.user.voice = MagicMock()
-        interaction.user.voice.channel = voice_channel
-        
-        control_cog = Control(bot)
-        subscribe_cog = Subscribe(bot)
-        
-        return {
-            'bot': bot,
-            'guild': guild,
-            'voice_channel': voice_channel,
-            'user': user,
-            'interaction': interaction,
-            'control_cog': control_cog,
-            'subscribe_cog': subscribe_cog
-        }
+    def error_test_environment(self, _env_prototype):
+        """Fixture providing environment for error testing
+        
+        The bot, guild, cogs and user are shared across the module; only the
+        interaction is copied, with fresh response/channel mocks, because
+        tests assert on its calls.
+        """
+        env = dict(_env_prototype)
+        env['interaction'] = _clone_interaction(_env_prototype['interaction'])
+        return env
     
-    @pytest.mark.asyncio
     @pytest.mark.timeout(30)  # 30秒タイムアウト
-    async def test_discord_api_error_recovery(self, error_test_environment):
+    async def test_discord_api_error_recovery(self, error_test_environment, patched, session_spec):
         """Test recovery from Discord API errors"""
         env = error_test_environment
+        mocks = patched.control
         
-        with patch('cogs.control.Settings') as mock_settings, \
-             patch('cogs.control.session_controller') as mock_controller, \
-             patch('cogs.control.Session') as mock_session_class, \
-             patch('cogs.control.voice_validation') as mock_voice_validation, \
-             patch('cogs.control.logger') as mock_logger:
-            
-            # Setup mocks
-            mock_settings.is_valid_interaction = AsyncMock(return_value=True)
-            mock_voice_validation.can_connect.return_value = True
-            mock_voice_validation.is_voice_alone.return_value = True
-            
-            # Simulate Discord API error during session start
-            mock_controller.start_pomodoro = AsyncMock(
-                side_effect=HTTPException(response=MagicMock(), message="API Error")
-            )
-            
-            mock_session = MagicMock()
-            mock_session_class.return_value = mock_session
-            
-            # Try to start session (should handle error gracefully)
-            try:
-                await env['control_cog'].pomodoro.callback(
-                    env['control_cog'],
-                    env['interaction'],
-                    pomodoro=25,
-                    short_break=5,
-                    long_break=20,
-                    intervals=4
-                )
-            except HTTPException:
-                pass  # Expected to be caught by error handler
-            
-            # Verify error logging occurred
-            mock_logger.error.assert_called()
+        # Setup mocks
+        mocks.Settings.is_valid_interaction.return_value = True
+        mocks.voice_validation.can_connect.return_value = True
+        mocks.voice_validation.is_voice_alone.return_value = True
+        
+        # Simulate Discord API error during session start
+        mocks.session_controller.start_pomodoro.side_effect = _HTTP_ERR
+        
+        mocks.Session.return_value = MagicMock(spec_set=session_spec)
+        
+        # Try to start session; the cog's error handler must swallow the error
+        await env['control_cog'].pomodoro.callback(
+            env['control_cog'],
+            env['interaction'],
+            pomodoro=25,
+            short_break=5,
+            long_break=20,
+            intervals=4
+        )
+        
+        # Verify error logging occurred
+        assert_error_logged(mocks.logger)
     
-    @pytest.mark.asyncio
     @pytest.mark.timeout(30)
-    async def test_voice_connection_error_recovery(self, error_test_environment):
-        """Test recovery from voice connection errors"""
+    @pytest.mark.parametrize("side_effects", [
+        pytest.param({'vc_manager.connect': _VOICE_ERR}, id="voice_connection"),
+        pytest.param({
+            'vc_manager.connect': Exception("Voice error"),
+            'session_manager.activate': Exception("Manager error"),
+            'session_messenger.send_pomodoro_msg': Exception("Message error")
+        }, id="cascading"),
+    ])
+    async def test_start_pomodoro_failure_recovery(self, error_test_environment, patched, default_settings, session_deps, side_effects):
+        """Test that start_pomodoro logs a collaborator failure and re-raises it"""
         env = error_test_environment
+        mocks = patched.controller
         
-        with patch('src.session.session_controller.vc_manager') as mock_vc_manager, \
-             patch('src.session.session_controller.session_manager') as mock_session_manager, \
-             patch('src.session.session_controller.session_messenger') as mock_messenger, \
-             patch('src.session.session_controller.logger') as mock_logger:
-            
-            # Setup mocks
-            mock_session_manager.activate = AsyncMock()
-            mock_messenger.send_pomodoro_msg = AsyncMock()
-            
-            # Simulate voice connection failure
-            mock_vc_manager.connect = AsyncMock(
-                side_effect=DiscordException("Voice connection failed")
-            )
-            
-            # Create session
-            settings = Settings(duration=25, short_break=5, long_break=20, intervals=4)
-            
-            with patch('src.session.Session.Timer'), \
-                 patch('src.session.Session.Stats'), \
-                 patch('src.subscriptions.Subscription.Subscription'), \
-                 patch('src.subscriptions.AutoMute.AutoMute'):
-                
-                session = Session(State.POMODORO, settings, env['interaction'])
-                
-                from src.session import session_controller
-                
-                # Try to start session with voice connection error
-                try:
-                    await session_controller.start_pomodoro(session)
-                except DiscordException:
-                    pass  # Expected error
-                
-                # Verify error was logged
-                mock_logger.error.assert_called()
-                
-                # Verify voice connection was attempted
-                mock_vc_manager.connect.assert_called_once_with(session)
+        # Make each listed collaborator fail
+        for path, error in side_effects.items():
+            attrgetter(path)(mocks).side_effect = error
+        
+        session = Session(State.POMODORO, default_settings, env['interaction'])
+        
+        # The voice connection fails first, and that error propagates
+        with pytest.raises(type(side_effects['vc_manager.connect'])) as exc_info:
+            await session_controller.start_pomodoro(session)
+        assert exc_info.value is side_effects['vc_manager.connect']
+        
+        # Verify voice connection was attempted and the failure was logged
+        mocks.vc_manager.connect.assert_called_once_with(session)
+        assert_error_logged(mocks.logger)
+    
     
-    @pytest.mark.asyncio
     @pytest.mark.timeout(30)
-    async def test_session_corruption_recovery(self, error_test_environment):
+    async def test_session_corruption_recovery(self, error_test_environment, patched, session_spec):
         """Test recovery from corrupted session state"""
         env = error_test_environment
+        mocks = patched.control
+        
+        # Create corrupted session (missing required attributes)
+        corrupted_session = MagicMock(spec_set=session_spec)
+        corrupted_session.ctx = env['interaction']
+        corrupted_session.stats = None  # Corruption: missing stats
+        corrupted_session.timer = None  # Corruption: missing timer
         
-        with patch('cogs.control.session_manager') as mock_session_manager, \
-             patch('cogs.control.session_controller') as mock_controller, \
-             patch('cogs.control.voice_validation') as mock_voice_validation, \
-             patch('cogs.control.logger') as mock_logger:
+        mocks.session_manager.get_session_interaction.return_value = corrupted_session
+        mocks.voice_validation.require_same_voice_channel.return_value = True
+        
+        # Mock validation to pass
+        with patch.object(env['control_cog'], '_validate_and_setup_session', return_value=(True, "test_session")):
             
-            # Create corrupted session (missing required attributes)
-            corrupted_session = MagicMock()
-            corrupted_session.ctx = env['interaction']
-            corrupted_session.stats = None  # Corruption: missing stats
-            corrupted_session.timer = None  # Corruption: missing timer
+            # Try to execute command on corrupted session; stop catches the AttributeError itself
+            await env['control_cog'].stop.callback(env['control_cog'], env['interaction'])
             
-            mock_session_manager.get_session_interaction = AsyncMock(return_value=corrupted_session)
-            mock_voice_validation.require_same_voice_channel = AsyncMock(return_value=True)
+            # Verify error handling occurred  
+            assert_error_logged(mocks.logger)
             
-            # Mock validation to pass
-            with patch.object(env['control_cog'], '_validate_and_setup_session', return_value=(True, "test_session")):
-                
-                # Try to execute command on corrupted session
-                try:
-                    await env['control_cog'].stop.callback(env['control_cog'], env['interaction'])
-                except AttributeError:
-                    pass  # Expected due to corruption
-                
-                # Verify error handling occurred  
-                mock_logger.error.assert_called()
-                
-                # Note: corrupted session may not reach end() call due to validation failures
-                # The test verifies error handling occurs, not necessarily cleanup completion
+            # Note: corrupted session may not reach end() call due to validation failures
+            # The test verifies error handling occurs, not necessarily cleanup completion
     
-    @pytest.mark.asyncio
-    async def test_timer_exception_recovery(self, error_test_environment):
+    async def test_timer_exception_recovery(self, error_test_environment, patched, default_settings, session_deps):
         """Test recovery from timer-related exceptions"""
         env = error_test_environment
         
         # Simplified test that focuses on ensuring no infinite loops or timeouts occur
-        with patch('src.session.session_controller.session_manager') as mock_session_manager, \
-             patch('src.session.session_controller.run_interval') as mock_run_interval, \
-             patch('src.session.session_controller.state_handler') as mock_state_handler, \
-             patch('src.session.session_controller.countdown') as mock_countdown, \
-             patch('src.session.session_controller.logger') as mock_logger:
-            
-            # Setup mocks to prevent infinite loop
-            async def mock_run_interval_func(session):
-                return False  # Immediately return False to exit loop
-            mock_run_interval.side_effect = mock_run_interval_func
-            
-            # Mock state_handler.auto_mute to avoid issues
-            mock_state_handler.auto_mute = AsyncMock()
-            
-            # Create session with timer that throws exceptions
-            mock_timer = MagicMock()
-            mock_timer.start = MagicMock(side_effect=Exception("Timer error"))
-            
-            settings = Settings(duration=25, short_break=5, long_break=20, intervals=4)
-            
-            with patch('src.session.Session.Timer'), \
-                 patch('src.session.Session.Stats'), \
-                 patch('src.subscriptions.Subscription.Subscription'), \
-                 patch('src.subscriptions.AutoMute.AutoMute'):
-                
-                session = Session(State.POMODORO, settings, env['interaction'])
-                session.timer = mock_timer
-                
-                from src.session import session_controller
-                
-                # Test focus: ensure resume completes without timeout
-                start_time = asyncio.get_event_loop().time()
-                try:
-                    with asyncio.timeout(3):  # 3秒タイムアウト - 短時間で完了すべき
-                        await session_controller.resume(session)
-                except (Exception, asyncio.TimeoutError) as e:
-                    # If we get here without timeout, the fix worked
-                    pass
-                end_time = asyncio.get_event_loop().time()
-                
-                # The main success criterion is that we don't timeout
-                execution_time = end_time - start_time
-                assert execution_time < 2.0, f"Test took too long ({execution_time:.2f}s), possible infinite loop"
+        # Setup mocks to prevent infinite loop: exit the loop immediately
+        patched.controller.run_interval.return_value = False
+        
+        # Create session with timer that throws exceptions
+        mock_timer = MagicMock(spec_set=Timer)
+        mock_timer.set_time_remaining.side_effect = Exception("Timer error")
+        
+        session = Session(State.POMODORO, default_settings, env['interaction'])
+        session.timer = mock_timer
+        
+        # Test focus: ensure resume completes without timeout
+        start_time = asyncio.get_event_loop().time()
+        # A timeout is reported by the execution time assertion below
+        with suppress(TimeoutError):
+            async with asyncio.timeout(3):  # 3秒タイムアウト - 短時間で完了すべき
+                await session_controller.resume(session)
+        end_time = asyncio.get_event_loop().time()
+        
+        # The main success criterion is that we don't timeout
+        execution_time = end_time - start_time
+        assert execution_time < 2.0, f"Test took too long ({execution_time:.2f}s), possible infinite loop"
+        patched.controller.run_interval.assert_awaited_once_with(session)
     
-    @pytest.mark.asyncio
     @pytest.mark.timeout(30)
-    async def test_auto_mute_error_recovery(self, error_test_environment):
+    async def test_auto_mute_error_recovery(self, error_test_environment, patched, session_spec):
         """Test recovery from auto-mute operation errors"""
         env = error_test_environment
+        mocks = patched.subscribe
         
-        with patch('cogs.subscribe.session_manager') as mock_session_manager, \
-             patch('cogs.subscribe.vc_accessor') as mock_vc_accessor, \
-             patch('cogs.subscribe.voice_validation') as mock_voice_validation, \
-             patch('cogs.subscribe.logger') as mock_logger, \
-             patch('cogs.subscribe.u_msg') as mock_u_msg:
-            
-            # Create session with auto_mute that fails
-            mock_session = MagicMock()
-            mock_session.ctx = env['interaction']
-            mock_session.auto_mute = MagicMock()
-            mock_session.auto_mute.all = False
-            mock_session.auto_mute.handle_all = AsyncMock(
-                side_effect=Exception("Auto-mute operation failed")
-            )
-            
-            mock_session_manager.get_session_interaction = AsyncMock(return_value=mock_session)
-            mock_vc_accessor.get_voice_channel_interaction.return_value = env['voice_channel']
-            mock_vc_accessor.get_voice_channel.return_value = env['voice_channel']
-            mock_voice_validation.require_same_voice_channel = AsyncMock(return_value=True)
-            mock_u_msg.AUTOMUTE_ENABLE_FAILED = "Auto-mute failed"
-            
-            # Execute auto-mute command
-            await env['subscribe_cog'].enableautomute.callback(env['subscribe_cog'], env['interaction'])
-            
-            # Verify error was logged and handled gracefully
-            mock_logger.error.assert_called()
-            mock_logger.exception.assert_called()
-            
-            # Verify user was notified of failure
-            env['interaction'].channel.send.assert_called_with("Auto-mute failed", silent=True)
+        # Create session with auto_mute that fails
+        mock_session = MagicMock(spec_set=session_spec)
+        mock_session.ctx = env['interaction']
+        mock_session.auto_mute = SimpleNamespace(all=False, handle_all=patched.pool.handle_all)
+        patched.pool.handle_all.side_effect = Exception("Auto-mute operation failed")
+        
+        mocks.session_manager.get_session_interaction.return_value = mock_session
+        mocks.vc_accessor.get_voice_channel_interaction.return_value = env['voice_channel']
+        mocks.vc_accessor.get_voice_channel.return_value = env['voice_channel']
+        mocks.voice_validation.require_same_voice_channel.return_value = True
+        mocks.u_msg.AUTOMUTE_ENABLE_FAILED = "Auto-mute failed"
+        
+        # Execute auto-mute command
+        await env['subscribe_cog'].enableautomute.callback(env['subscribe_cog'], env['interaction'])
+        
+        # Verify error was logged and handled gracefully
+        assert_error_logged(mocks.logger, with_details=True)
+        
+        # Verify user was notified of failure
+        env['interaction'].channel.send.assert_called_with("Auto-mute failed", silent=True)
     
-    @pytest.mark.asyncio
     @pytest.mark.timeout(30)
-    async def test_session_manager_corruption_recovery(self, error_test_environment):
+    async def test_session_manager_corruption_recovery(self, error_test_environment, patched):
         """Test recovery from session manager state corruption"""
         env = error_test_environment
+        mocks = patched.control
         
         # Corrupt session manager state
         session_manager.active_sessions["corrupted_guild"] = "not_a_session_object"
         session_manager.active_sessions[str(env['guild'].id)] = None
         
-        with patch('cogs.control.session_manager') as mock_session_manager, \
-             patch('cogs.control.logger') as mock_logger:
-            
-            # Use real session_manager but with corrupted state
-            mock_session_manager.active_sessions = session_manager.active_sessions
-            mock_session_manager.session_id_from.side_effect = session_manager.session_id_from
-            
-            async def mock_get_session_interaction(interaction):
-                guild_id = session_manager.session_id_from(interaction)
-                session = session_manager.active_sessions.get(guild_id)
-                if session is None or not hasattr(session, 'ctx'):
-                    return None
-                return session
-            
-            mock_session_manager.get_session_interaction = mock_get_session_interaction
-            
-            # Try to get session from corrupted state
-            result = await mock_session_manager.get_session_interaction(env['interaction'])
-            
-            # Should handle corruption gracefully
-            assert result is None
+        # Use real session_manager state (wired up by the patched fixture) but corrupted
+        async def mock_get_session_interaction(interaction):
+            guild_id = session_manager.session_id_from(interaction)
+            session = session_manager.active_sessions.get(guild_id)
+            if session is None or not hasattr(session, 'ctx'):
+                return None
+            return session
+        
+        mocks.session_manager.get_session_interaction.side_effect = mock_get_session_interaction
+        
+        # Try to get session from corrupted state
+        result = await mocks.session_manager.get_session_interaction(env['interaction'])
+        
+        # Should handle corruption gracefully
+        assert result is None
     
-    @pytest.mark.asyncio
-    async def test_command_error_handler_integration(self, error_test_environment):
+    async def test_command_error_handler_integration(self, error_test_environment, patched):
         """Test integration with command error handlers"""
         env = error_test_environment
+        mocks = patched.control
         
         # Test pomodoro command error handler
-        with patch('cogs.control.logger') as mock_logger, \
-             patch('cogs.control.u_msg') as mock_u_msg:
-            
-            mock_u_msg.POMODORO_COMMAND_ERROR = "Pomodoro command failed"
-            
-            # Create a command error
-            from discord import app_commands
-            command = MagicMock()
-            error = app_commands.CommandInvokeError(command, Exception("Test error"))
-            
-            # Test error handler
-            await env['control_cog'].pomodoro_error(env['interaction'], error)
-            
-            # Verify error was logged and user was notified
-            mock_logger.error.assert_called()
-            mock_logger.exception.assert_called()
-            
-            # Check if response was sent (depends on interaction state)
-            if not env['interaction'].response.is_done():
-                env['interaction'].response.send_message.assert_called_once()
-            else:
-                env['interaction'].followup.send.assert_called_once()
-    
-    @pytest.mark.asyncio
-    async def test_cascading_failure_recovery(self, error_test_environment):
-        """Test recovery from cascading failures"""
-        env = error_test_environment
+        mocks.u_msg.POMODORO_COMMAND_ERROR = "Pomodoro command failed"
         
-        with patch('src.session.session_controller.vc_manager') as mock_vc_manager, \
-             patch('src.session.session_controller.session_manager') as mock_session_manager, \
-             patch('src.session.session_controller.session_messenger') as mock_messenger, \
-             patch('src.session.session_controller.logger') as mock_logger:
-            
-            # Setup cascading failures
-            mock_vc_manager.connect = AsyncMock(side_effect=Exception("Voice error"))
-            mock_session_manager.activate = AsyncMock(side_effect=Exception("Manager error"))
-            mock_messenger.send_pomodoro_msg = AsyncMock(side_effect=Exception("Message error"))
-            
-            settings = Settings(duration=25, short_break=5, long_break=20, intervals=4)
-            
-            with patch('src.session.Session.Timer'), \
-                 patch('src.session.Session.Stats'), \
-                 patch('src.subscriptions.Subscription.Subscription'), \
-                 patch('src.subscriptions.AutoMute.AutoMute'):
-                
-                session = Session(State.POMODORO, settings, env['interaction'])
-                
-                from src.session import session_controller
-                
-                # Try to start session with multiple failures
-                try:
-                    await session_controller.start_pomodoro(session)
-                except Exception:
-                    pass  # Expected due to cascading failures
-                
-                # Verify all failure points were attempted and logged
-                mock_vc_manager.connect.assert_called_once()
-                mock_logger.error.assert_called()  # Should have logged errors
+        # Test error handler with a command error
+        await env['control_cog'].pomodoro_error(env['interaction'], _CMD_ERR)
+        
+        # Verify error was logged and user was notified
+        assert_error_logged(mocks.logger, with_details=True)
+        
+        # Check if response was sent (depends on interaction state)
+        if not env['interaction'].response.is_done():
+            env['interaction'].response.send_message.assert_called_once()
+        else:
+            env['interaction'].followup.send.assert_called_once()
+    
     
-    @pytest.mark.asyncio
-    async def test_graceful_degradation(self, error_test_environment):
+    async def test_graceful_degradation(self, error_test_environment, patched, session_spec):
         """Test graceful degradation when non-critical features fail"""
         env = error_test_environment
+        mocks = patched.control
         
-        with patch('cogs.control.Settings') as mock_settings, \
-             patch('cogs.control.session_controller') as mock_controller, \
-             patch('cogs.control.Session') as mock_session_class, \
-             patch('cogs.control.voice_validation') as mock_voice_validation:
-            
-            # Setup core functionality to work
-            mock_settings.is_valid_interaction = AsyncMock(return_value=True)
-            mock_voice_validation.can_connect.return_value = True
-            mock_voice_validation.is_voice_alone.return_value = True
-            
-            # Create session that works despite some subsystem failures
-            mock_session = MagicMock()
-            mock_session.ctx = env['interaction']
-            mock_session_class.return_value = mock_session
-            
-            # Mock session controller to succeed (core functionality)
-            mock_controller.start_pomodoro = AsyncMock()
-            
-            # Start session (should work even if some features are broken)
-            await env['control_cog'].pomodoro.callback(
-                env['control_cog'],
-                env['interaction'],
-                pomodoro=25,
-                short_break=5,
-                long_break=20,
-                intervals=4
-            )
-            
-            # Verify core functionality still worked
-            mock_session_class.assert_called_once()
-            mock_controller.start_pomodoro.assert_called_once_with(mock_session)
-            env['interaction'].response.defer.assert_called_once()
\ No newline at end of file
+        # Setup core functionality to work
+        mocks.Settings.is_valid_interaction.return_value = True
+        mocks.voice_validation.can_connect.return_value = True
+        mocks.voice_validation.is_voice_alone.return_value = True
+        
+        # Create session that works despite some subsystem failures
+        mock_session = MagicMock(spec_set=session_spec)
+        mock_session.ctx = env['interaction']
+        mocks.Session.return_value = mock_session
+        
+        # Session controller succeeds (core functionality)
+        mocks.session_controller.start_pomodoro.return_value = None
+        
+        # Start session (should work even if some features are broken)
+        await env['control_cog'].pomodoro.callback(
+            env['control_cog'],
+            env['interaction'],
+            pomodoro=25,
+            short_break=5,
+            long_break=20,
+            intervals=4
+        )
+        
+        # Verify core functionality still worked
+        mocks.Session.assert_called_once()
+        mocks.session_controller.start_pomodoro.assert_awaited_once_with(mock_session)
+        env['interaction'].response.defer.assert_called_once()
@@ -9,29 +9,65 @@ import asyncio
 from unittest.mock import MagicMock, AsyncMock, patch
 import discord
 from tests.mocks.discord_mocks import (
-    MockGuild, MockVoiceChannel, MockMember, MockUser, MockBot,
+    MockGuild, MockVoiceChannel, MockMember, MockBot,
     MockVoiceState, MockInteraction
 )
 from cogs.subscribe import Subscribe
 from src.subscriptions.AutoMute import AutoMute
+from configs import config
+
+# 全テストがモックのみをawaitするため、テストごとにループを作らずモジュールで1つ共有する
+pytestmark = pytest.mark.asyncio(scope="module")
+
+# side_effectとして使い回す権限エラー（例外インスタンスは何度でもraiseできる）
+_FAKE_RESPONSE = MagicMock(status=403, reason="Forbidden")
+_FORBIDDEN = discord.Forbidden(response=_FAKE_RESPONSE, message="Missing permissions")
+# 操作途中で権限を失った場合のメンバーごとのedit結果（3番目以降が失敗）
+_PERMISSION_CHANGE_SIDE_EFFECTS = [None, None, _FORBIDDEN, _FORBIDDEN, _FORBIDDEN]
+
+
+@pytest.fixture(scope="module")
+def guild():
+    """モジュール共通のギルド"""
+    return MockGuild(id=12345)
+
+
+@pytest.fixture(scope="module")
+def subscribe_cog():
+    """モジュール共通のSubscribeコグ（状態を持たないため共有できる）"""
+    return Subscribe(MockBot())
+
+
+@pytest.fixture(scope="module")
+def member_pool(guild):
+    """使い回すメンバーのプール（IDは0から連番）"""
+    return MockMember.bulk(guild, 16)
+
+
+@pytest.fixture(autouse=True)
+def reset_member_pool(member_pool):
+    """テスト後にプール内メンバーのeditの設定と呼び出し履歴、共有例外の状態を消す"""
+    yield
+    for member in member_pool:
+        member.edit.reset_mock(return_value=True, side_effect=True)
+    # raiseのたびに積み重なるトレースバック（とそのフレーム）を捨てる
+    _FORBIDDEN.__traceback__ = None
 
 
 class TestAutoMuteBasicFunctionality:
     """AutoMute基本機能のテスト"""
     
-    def setup_method(self):
-        """テストセットアップ"""
-        self.bot = MockBot()
-        self.subscribe_cog = Subscribe(self.bot)
-        self.guild = MockGuild(id=12345)
-        self.voice_channel = MockVoiceChannel(id=67890, name="test-voice", guild=self.guild)
-        self.interaction = MockInteraction(guild=self.guild)
+    @pytest.fixture(autouse=True)
+    def setup(self, guild):
+        """テストセットアップ（AutoMuteとインタラクションはテストごとに作り直す）"""
+        self.guild = guild
+        self.voice_channel = MockVoiceChannel(id=67890, name="test-voice", guild=guild)
+        self.interaction = MockInteraction(guild=guild)
         self.automute = AutoMute()
     
-    @pytest.mark.asyncio
-    async def test_mute_member_success(self):
+    async def test_mute_member_success(self, member_pool):
         """メンバーミュート成功テスト"""
-        member = MockMember(guild=self.guild)
+        member = member_pool[0]
         
         with patch('src.subscriptions.AutoMute.vc_accessor') as mock_vc_accessor:
             mock_vc_accessor.get_true_members_in_voice_channel.return_value = [member]
@@ -44,10 +80,9 @@ class TestAutoMuteBasicFunctionality:
                 # safe_edit_memberが正しいパラメータで呼ばれることを確認
                 mock_safe_edit.assert_called_once_with(member)
     
-    @pytest.mark.asyncio
-    async def test_unmute_member_success(self):
+    async def test_unmute_member_success(self, member_pool):
         """メンバーアンミュート成功テスト"""
-        member = MockMember(guild=self.guild)
+        member = member_pool[0]
         
         with patch('src.subscriptions.AutoMute.vc_accessor') as mock_vc_accessor:
             mock_vc_accessor.get_true_members_in_voice_channel.return_value = [member]
@@ -60,20 +95,43 @@ class TestAutoMuteBasicFunctionality:
                 # safe_edit_memberが正しいパラメータで呼ばれることを確認
                 mock_safe_edit.assert_called_once_with(member, unmute=True)
     
-    @pytest.mark.asyncio
-    async def test_mute_member_permission_error(self):
+    async def test_mute_all_limits_concurrent_edits(self, member_pool):
+        """全員ミュート時のmember.edit同時実行数が上限を超えないことを確認"""
+        members = member_pool[:12]
+        in_flight = 0
+        peak = 0
+        
+        async def yielding_edit(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+        
+        for member in members:
+            member.edit.side_effect = yielding_edit
+        
+        with patch('src.subscriptions.AutoMute.vc_accessor') as mock_vc_accessor:
+            mock_vc_accessor.get_true_members_in_voice_channel.return_value = members
+            mock_vc_accessor.get_voice_channel.return_value = self.voice_channel
+            
+            await self.automute.mute(self.interaction, who="all")
+        
+        # 並行実行されつつ、同時実行数は上限で頭打ちになる
+        assert peak == config.AUTOMUTE_MAX_CONCURRENT_EDITS
+        for member in members:
+            member.edit.assert_awaited_once_with(mute=True)
+    
+    async def test_mute_member_permission_error(self, member_pool):
         """ミュート時権限エラーテスト"""
-        member = MockMember(guild=self.guild)
+        member = member_pool[0]
         
         with patch('src.subscriptions.AutoMute.vc_accessor') as mock_vc_accessor:
             mock_vc_accessor.get_true_members_in_voice_channel.return_value = [member]
             mock_vc_accessor.get_voice_channel.return_value = self.voice_channel
             
             # member.editで権限エラーを発生させる
-            member.edit.side_effect = discord.Forbidden(
-                response=MagicMock(),
-                message="Missing permissions"
-            )
+            member.edit.side_effect = _FORBIDDEN
             
             # 権限エラーが適切に処理されることを確認（例外が発生しないことを確認）
             await self.automute.mute(self.interaction, who="all")
@@ -81,7 +139,6 @@ class TestAutoMuteBasicFunctionality:
             # member.editが呼ばれたことを確認
             member.edit.assert_called_once_with(mute=True)
     
-    @pytest.mark.asyncio
     async def test_handle_all_enable_mute(self):
         """全メンバーミュート有効化テスト（ステート変更のみテスト）"""
         # 初期状態でall=Falseであることを確認
@@ -91,7 +148,6 @@ class TestAutoMuteBasicFunctionality:
         self.automute.all = True
         assert self.automute.all == True
     
-    @pytest.mark.asyncio
     async def test_handle_all_disable_mute(self):
         """全メンバーミュート無効化テスト（ステート変更のみテスト）"""
         # ミュート状態に設定
@@ -106,27 +162,32 @@ class TestAutoMuteBasicFunctionality:
 class TestComplexVoiceChannelMovements:
     """複雑なボイスチャンネル移動のテスト"""
     
-    def setup_method(self):
-        """テストセットアップ"""
-        self.bot = MockBot()
-        self.subscribe_cog = Subscribe(self.bot)
-        self.guild = MockGuild(id=12345)
-        
-        # 複数のボイスチャンネルを作成
-        self.voice_channel1 = MockVoiceChannel(id=11111, name="channel1", guild=self.guild)
-        self.voice_channel2 = MockVoiceChannel(id=22222, name="channel2", guild=self.guild)
-        self.voice_channel3 = MockVoiceChannel(id=33333, name="channel3", guild=self.guild)
-        
-        self.guild.voice_channels = [
-            self.voice_channel1, 
-            self.voice_channel2, 
-            self.voice_channel3
+    @pytest.fixture(scope="class")
+    def voice_channels(self, guild):
+        """複数のボイスチャンネル（テストからは読み取るだけなのでクラスで共有）
+
+        guildはモジュール共通なので、クラス終了時にvoice_channelsを元に戻す
+        """
+        channels = [
+            MockVoiceChannel(id=11111, name="channel1", guild=guild),
+            MockVoiceChannel(id=22222, name="channel2", guild=guild),
+            MockVoiceChannel(id=33333, name="channel3", guild=guild)
         ]
+        original = guild.voice_channels
+        guild.voice_channels = channels
+        yield channels
+        guild.voice_channels = original
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, guild, subscribe_cog, voice_channels):
+        """テストセットアップ"""
+        self.subscribe_cog = subscribe_cog
+        self.guild = guild
+        self.voice_channel1, self.voice_channel2, self.voice_channel3 = voice_channels
     
-    @pytest.mark.asyncio
-    async def test_rapid_channel_switching(self):
+    async def test_rapid_channel_switching(self, member_pool):
         """高速チャンネル切り替えテスト"""
-        member = MockMember(guild=self.guild)
+        member = member_pool[0]
         
         # 高速でチャンネル間を移動
         channels = [self.voice_channel1, self.voice_channel2, self.voice_channel3, None]
@@ -137,13 +198,12 @@ class TestComplexVoiceChannelMovements:
             
             await self.subscribe_cog.on_voice_state_update(member, before_state, after_state)
             
-            # 短時間の間隔をシミュレート
-            await asyncio.sleep(0.01)
+            # 次の移動の前に他のタスクへ制御を譲る（実時間の待機は不要）
+            await asyncio.sleep(0)
     
-    @pytest.mark.asyncio
-    async def test_simultaneous_multi_channel_movements(self):
+    async def test_simultaneous_multi_channel_movements(self, member_pool):
         """同時多チャンネル移動テスト"""
-        members = [MockMember(guild=self.guild, user=MockUser(id=i)) for i in range(10)]
+        members = member_pool[:10]
         
         # 複数メンバーが同時に異なるチャンネルに移動
         tasks = []
@@ -158,10 +218,9 @@ class TestComplexVoiceChannelMovements:
         # 同時実行
         await asyncio.gather(*tasks)
     
-    @pytest.mark.asyncio
-    async def test_channel_cascade_movement(self):
+    async def test_channel_cascade_movement(self, member_pool):
         """チャンネル連鎖移動テスト"""
-        members = [MockMember(guild=self.guild, user=MockUser(id=i)) for i in range(5)]
+        members = member_pool[:5]
         
         # メンバーが連鎖的にチャンネルを移動（玉突き状態）
         for round_num in range(3):
@@ -178,14 +237,13 @@ class TestComplexVoiceChannelMovements:
 class TestPermissionScenarios:
     """権限シナリオのテスト"""
     
-    def setup_method(self):
-        """テストセットアップ"""
-        self.bot = MockBot()
-        self.guild = MockGuild(id=12345)
-        self.voice_channel = MockVoiceChannel(id=67890, name="test-voice", guild=self.guild)
-        self.interaction = MockInteraction(guild=self.guild)
+    @pytest.fixture(autouse=True)
+    def setup(self, guild):
+        """テストセットアップ（ボイスチャンネルはテスト内でmembersを書き換えるため毎回作る）"""
+        self.guild = guild
+        self.voice_channel = MockVoiceChannel(id=67890, name="test-voice", guild=guild)
+        self.interaction = MockInteraction(guild=guild)
     
-    @pytest.mark.asyncio
     async def test_basic_permission_check(self):
         """基本的な権限チェック（簡素化版）"""
         # 基本的な権限チェックのみテスト
@@ -198,41 +256,29 @@ class TestPermissionScenarios:
         automute.all = True
         assert automute.all == True
     
-    @pytest.mark.asyncio
-    async def test_permission_changes_during_operation(self):
+    async def test_permission_changes_during_operation(self, member_pool):
         """操作中の権限変更テスト"""
-        members = [MockMember(guild=self.guild) for _ in range(5)]
+        members = member_pool[:5]
         self.voice_channel.members = members
         
-        # 途中で権限が変更される状況をシミュレート
-        def edit_with_permission_change(call_count=[0]):
-            call_count[0] += 1
-            if call_count[0] > 2:  # 3回目以降は権限エラー
-                raise discord.Forbidden(response=MagicMock(), message="Permission changed")
-            return AsyncMock()
-        
-        for i, member in enumerate(members):
-            if i >= 2:  # 3番目以降のメンバーは権限エラー
-                member.edit = AsyncMock(side_effect=discord.Forbidden(
-                    response=MagicMock(),
-                    message="Permission changed"
-                ))
+        # 途中で権限が変更される状況をシミュレート（3番目以降のメンバーは権限エラー）
+        for member, side_effect in zip(members, _PERMISSION_CHANGE_SIDE_EFFECTS):
+            member.edit.side_effect = side_effect
         
         automute = AutoMute()
         
         # 権限変更が適切に処理されることを確認
         await automute.handle_all(self.interaction, enable=True)
     
-    @pytest.mark.asyncio
-    async def test_bot_role_moved_during_mute(self):
+    async def test_bot_role_moved_during_mute(self, member_pool):
         """ミュート中のBot役割移動テスト"""
-        member = MockMember(guild=self.guild)
+        member = member_pool[0]
         
         # 最初は成功、後で権限不足
-        member.edit = AsyncMock(side_effect=[
+        member.edit.side_effect = [
             None,  # 最初は成功
-            discord.Forbidden(response=MagicMock(), message="Role moved")  # 後で失敗
-        ])
+            _FORBIDDEN  # 後で失敗
+        ]
         
         automute = AutoMute()
         